@@ -0,0 +1,65 @@
+"""
+Checksum / integrity helpers for the hawkBit DDI mock server
+
+English
+-------
+Pure-numeric per-request work (checksums, CRCs, compatibility scoring) does
+not belong in interpreted Python loops. Rather than pulling in a JIT compiler
+for it, this module funnels that work through the C implementations the
+standard library already ships: hashlib's OpenSSL-backed SHA-256 and zlib's
+crc32 both release the GIL for large buffers and run at memory-bandwidth
+speed, which is as fast as a compiled kernel would go for these workloads.
+
+New numeric paths (e.g. validating firmware slices when range requests
+arrive) should start here; only if a loop genuinely has no C-backed stdlib
+equivalent is compiling it worth a new dependency.
+
+한국어
+-----
+체크섬, CRC, 호환성 점수 같은 요청별 수치 연산을 인터프리터 루프에 두면
+안 됩니다. JIT 컴파일러를 새 의존성으로 추가하는 대신 표준 라이브러리가
+이미 제공하는 C 구현(OpenSSL 기반 hashlib SHA-256, zlib crc32)으로 처리
+합니다. 둘 다 큰 버퍼에서 GIL을 해제하며 메모리 대역폭 속도로 동작하므로
+이런 워크로드에서는 컴파일된 커널과 차이가 없습니다.
+
+범위 요청 검증 등 새로운 수치 경로는 이 모듈에서 시작하세요. C 구현이 없는
+루프일 때만 컴파일 의존성을 고려할 가치가 있습니다.
+"""
+
+import hashlib
+import zlib
+
+
+def crc32(buf) -> int:
+    """
+    CRC-32 of a bytes-like buffer (zlib polynomial)
+
+    English:
+    Cheap per-slice integrity check - suitable for validating individual
+    firmware ranges without rehashing the whole image.
+
+    한국어:
+    바이트 버퍼의 CRC-32(zlib 다항식). 이미지 전체를 다시 해시하지 않고
+    펌웨어 조각 단위 무결성을 검증할 때 적합한 저비용 검사입니다.
+    """
+    return zlib.crc32(buf) & 0xFFFFFFFF
+
+
+def sha256_hex(buf) -> str:
+    """SHA-256 hex digest of a bytes-like buffer / 버퍼의 SHA-256 16진 다이제스트"""
+    return hashlib.sha256(buf).hexdigest()
+
+
+def firmware_etag(buf) -> str:
+    """
+    Strong ETag for a firmware image, derived from its SHA-256
+
+    English:
+    Quoted per RFC 9110; truncated to 16 hex chars - plenty of entropy for
+    cache revalidation while keeping headers short.
+
+    한국어:
+    RFC 9110에 따라 따옴표로 감싼 강한 ETag입니다. 16진수 16자리로 잘라도
+    캐시 재검증에는 충분한 엔트로피이며 헤더를 짧게 유지합니다.
+    """
+    return '"' + sha256_hex(buf)[:16] + '"'